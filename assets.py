@@ -0,0 +1,293 @@
+"""Static asset pipeline behind `flask assets-build` and `flask assets-vendor`.
+
+Page styles and scripts live in static/css and static/js. The build writes minified, content-hashed
+copies of them (and of static/vendor) to static/dist with a manifest, which app.asset_url() reads to
+link the built files; until it has run, the source files are linked with a ?v= hash.
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import posixpath
+import re
+import shutil
+import urllib.request
+from urllib.parse import urljoin, urlsplit
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+ASSET_SOURCE_DIRS = ('css', 'js', 'vendor')
+ASSET_DIST_DIR = 'dist'
+# Both relative to the static folder.
+ASSET_MANIFEST = f'{ASSET_DIST_DIR}/manifest.json'
+ASSET_SIZE_REPORT = f'{ASSET_DIST_DIR}/size-report.txt'
+
+# Third-party files linked from the templates, by their name under static/vendor.
+VENDOR_FILES = {
+    'bootstrap.min.css': 'https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/css/bootstrap.min.css',
+    'bootstrap.bundle.min.js': 'https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js',
+    'fontawesome.min.css': 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.0/css/all.min.css',
+    'poppins.css': 'https://fonts.googleapis.com/css2?family=Poppins:wght@400;500;600;700&display=swap',
+    'chart.umd.js': 'https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.js',
+}
+# Google Fonts picks the font format from the User-Agent; this one gets woff2.
+VENDOR_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+CSS_URL_RE = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+
+def minify_css(source):
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{};,>])\s*', r'\1', source)
+    source = re.sub(r':\s+', ':', source)
+    return source.replace(';}', '}').strip()
+
+JS_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+JS_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw', 'yield', 'await'}
+
+def minify_js(source):
+    """Strips comments, indentation and blank lines from a script.
+
+    Line breaks are kept, so automatic semicolon insertion sees the same statements, and strings,
+    template literals and regular expressions are copied as they are.
+    """
+    out = []
+    line_start = True
+    template_depths = []  # open `{` count inside each ${...} of the enclosing template literals
+    i, n = 0, len(source)
+
+    def newline():
+        nonlocal line_start
+        while out and out[-1] in ' \t':
+            out.pop()
+        if not line_start:
+            out.append('\n')
+            line_start = True
+
+    def skip_past(j, end):
+        # Index just past the first unescaped `end` at or after j.
+        while j < n and source[j] != end:
+            j += 2 if source[j] == '\\' else 1
+        return j + 1
+
+    def regex_allowed():
+        k = len(out) - 1
+        while k >= 0 and out[k] in ' \t\n':
+            k -= 1
+        if k < 0 or out[k] in JS_REGEX_PRECEDERS:
+            return True
+        word = re.search(r'[A-Za-z_$][\w$]*$', ''.join(out[max(0, k - 10):k + 1]))
+        return bool(word) and word.group(0) in JS_REGEX_KEYWORDS
+
+    def scan_template(j):
+        # Returns the index just past the template literal's closing backtick, or of a `${`.
+        while j < n:
+            if source[j] == '\\':
+                j += 2
+            elif source[j] == '`':
+                return j + 1, False
+            elif source.startswith('${', j):
+                return j + 2, True
+            else:
+                j += 1
+        return j, False
+
+    while i < n:
+        ch = source[i]
+        if source.startswith('//', i):
+            while i < n and source[i] != '\n':
+                i += 1
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            end = n if end < 0 else end + 2
+            if '\n' in source[i:end]:
+                newline()
+            elif not line_start:
+                out.append(' ')
+            i = end
+        elif ch == '\n':
+            newline()
+            i += 1
+        elif ch in ' \t\r' and line_start:
+            i += 1
+        elif ch in '\'"':
+            j = skip_past(i + 1, ch)
+            out.append(source[i:j])
+            line_start, i = False, j
+        elif ch == '`' or (ch == '}' and template_depths and template_depths[-1] == 0):
+            if ch == '}':
+                template_depths.pop()
+            j, opened = scan_template(i + 1)
+            if opened:
+                template_depths.append(0)
+            out.append(source[i:j])
+            line_start, i = False, j
+        elif ch == '/' and regex_allowed():
+            j, in_class = i + 1, False
+            while j < n and (in_class or source[j] != '/'):
+                if source[j] == '\\':
+                    j += 1
+                elif source[j] == '[':
+                    in_class = True
+                elif source[j] == ']':
+                    in_class = False
+                j += 1
+            out.append(source[i:j + 1])
+            line_start, i = False, j + 1
+        else:
+            if template_depths and ch in '{}':
+                template_depths[-1] += 1 if ch == '{' else -1
+            out.append(ch)
+            line_start, i = False, i + 1
+    newline()
+    return ''.join(out)
+
+def _asset_sources():
+    for folder in ASSET_SOURCE_DIRS:
+        for dirpath, _, filenames in os.walk(os.path.join(current_app.static_folder, folder)):
+            for filename in sorted(filenames):
+                yield os.path.relpath(os.path.join(dirpath, filename), current_app.static_folder).replace(os.sep, '/')
+
+def _hashed_css_url(match, css_path, manifest):
+    url = match.group(2)
+    if ':' in url or url.startswith('/'):
+        return match.group(0)
+    base = posixpath.dirname(css_path)
+    target = posixpath.normpath(posixpath.join(base, url))
+    if target not in manifest:
+        return match.group(0)
+    return f"url({posixpath.relpath(manifest[target], posixpath.join(ASSET_DIST_DIR, base))})"
+
+def build_assets():
+    """Writes minified, content-hashed copies of the static sources and returns the manifest.
+
+    Text files also get .gz (and, with brotli installed, .br) copies for static_file to send. Stylesheets are written last so their relative url() references can point at the hashed copies.
+    """
+    # Imported here, as app.py imports this module to register the commands.
+    from app import COMPRESS_MIMETYPES, PRECOMPRESSED_SUFFIXES, available_encodings, compress
+
+    dist = os.path.join(current_app.static_folder, ASSET_DIST_DIR)
+    shutil.rmtree(dist, ignore_errors=True)
+    manifest = {}
+    for path in sorted(_asset_sources(), key=lambda p: p.endswith('.css')):
+        with open(os.path.join(current_app.static_folder, path), 'rb') as f:
+            data = f.read()
+        stem, ext = os.path.splitext(path)
+        if ext == '.css':
+            source = data.decode('utf-8')
+            if not stem.endswith('.min'):
+                source = minify_css(source)
+
+            data = CSS_URL_RE.sub(lambda m: _hashed_css_url(m, path, manifest), source).encode('utf-8')
+        elif ext == '.js' and not stem.endswith('.min') and not path.startswith('vendor/'):
+            data = minify_js(data.decode('utf-8')).encode('utf-8')
+        built = f"{ASSET_DIST_DIR}/{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+        os.makedirs(os.path.dirname(os.path.join(current_app.static_folder, built)), exist_ok=True)
+        with open(os.path.join(current_app.static_folder, built), 'wb') as f:
+            f.write(data)
+        if mimetypes.guess_type(path)[0] in COMPRESS_MIMETYPES:
+            for encoding in available_encodings():
+                with open(os.path.join(current_app.static_folder, f"{built}.{PRECOMPRESSED_SUFFIXES[encoding]}"), 'wb') as f:
+                    f.write(compress(data, encoding, static=True))
+        manifest[path] = built
+    with open(os.path.join(current_app.static_folder, ASSET_MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+def asset_size_report(manifest):
+    """Per-file and per-page transfer sizes after a build, as a printable table.
+
+    A page's "inline" size is its template with its own stylesheet and script embedded, as every page
+    was sent before the assets were split out. A first visit also downloads the built assets; a
+    repeat visit only the HTML, since the assets are cached. Sizes are gzipped bytes (fonts and images
+    as they are); CDN files are not counted.
+    """
+    def gzipped(data):
+        return len(gzip.compress(data))
+
+    def read(path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    lines = [f"{'file':<44} {'source':>8} {'built':>8} {'gzip':>8}"]
+    built_sizes = {}
+    for path, built in sorted(manifest.items()):
+        data = read(os.path.join(current_app.static_folder, built))
+        gz_path = os.path.join(current_app.static_folder, f'{built}.gz')
+        built_sizes[path] = os.path.getsize(gz_path) if os.path.exists(gz_path) else len(data)
+        lines.append(f"{path:<44} {os.path.getsize(os.path.join(current_app.static_folder, path)):>8} {len(data):>8} {built_sizes[path]:>8}")
+
+    template_folder = os.path.join(current_app.root_path, current_app.template_folder)
+    ref_re = re.compile(r"""(asset_url|vendor_url)\('([^']+)'\)""")
+
+    def assets_of(source):
+        refs = [path if kind == 'asset_url' else f'vendor/{path}' for kind, path in ref_re.findall(source)]
+        return [path for path in refs if path in manifest]
+
+    base_assets = assets_of(read(os.path.join(template_folder, 'base.html')).decode('utf-8'))
+    lines += ['', f"{'page':<32} {'inline':>8} {'html':>8} {'first':>8} {'repeat':>8}"]
+    totals = [0, 0, 0]
+    for filename in sorted(os.listdir(template_folder)):
+        source = read(os.path.join(template_folder, filename))
+        if filename == 'base.html' or not source.startswith(b'{% extends "base.html" %}'):
+            continue
+        page_assets = assets_of(source.decode('utf-8'))
+        own = b''.join(read(os.path.join(current_app.static_folder, path)) for path in page_assets if not path.startswith('vendor/'))
+        inline, html = gzipped(source + own), gzipped(source)
+        first = html + sum(built_sizes[path] for path in set(base_assets + page_assets))
+        totals = [totals[0] + inline, totals[1] + first, totals[2] + html]
+        lines.append(f"{filename:<32} {inline:>8} {html:>8} {first:>8} {html:>8}")
+    lines.append(f"{'all pages, one visit each':<32} {totals[0]:>8} {'':>8} {totals[1]:>8} {totals[2]:>8}")
+    return '\n'.join(lines)
+
+def _fetch_vendor_file(url):
+    with urllib.request.urlopen(urllib.request.Request(url, headers={'User-Agent': VENDOR_USER_AGENT}), timeout=30) as response:
+        return response.read()
+
+@click.command("assets-vendor")
+@with_appcontext
+def assets_vendor_command():
+    """Downloads the CDN files in VENDOR_FILES, and the fonts their stylesheets load, into static/vendor."""
+    vendor = os.path.join(current_app.static_folder, 'vendor')
+    os.makedirs(os.path.join(vendor, 'files'), exist_ok=True)
+    for name, url in VENDOR_FILES.items():
+        data = _fetch_vendor_file(url)
+        if name.endswith('.css'):
+            fetched = {}
+
+            def localize(match, css_url=url):
+                ref = match.group(2)
+                if ref.startswith('data:'):
+                    return match.group(0)
+                file_url = urljoin(css_url, ref)
+                filename = posixpath.basename(urlsplit(file_url).path)
+                if file_url not in fetched:
+                    with open(os.path.join(vendor, 'files', filename), 'wb') as f:
+                        f.write(_fetch_vendor_file(file_url))
+                    fetched[file_url] = filename
+                return f"url(files/{filename})"
+
+            data = CSS_URL_RE.sub(localize, data.decode('utf-8')).encode('utf-8')
+            print(f"Fetched {name} and {len(fetched)} font files")
+        else:
+            print(f"Fetched {name}")
+        with open(os.path.join(vendor, name), 'wb') as f:
+            f.write(data)
+    print("Set VENDOR_ASSETS=1 to serve them, then run `flask assets-build`.")
+
+@click.command("assets-build")
+@with_appcontext
+def assets_build_command():
+    """Writes minified, content-hashed static assets to static/dist and prints a size report."""
+    manifest = build_assets()
+    report = asset_size_report(manifest)
+    with open(os.path.join(current_app.static_folder, ASSET_SIZE_REPORT), 'w') as f:
+        f.write(report + '\n')
+    print(report)
+    print(f"\nBuilt {len(manifest)} files; report saved to static/{ASSET_SIZE_REPORT}.")
+
+def register_asset_commands(app):
+    app.cli.add_command(assets_vendor_command)
+    app.cli.add_command(assets_build_command)
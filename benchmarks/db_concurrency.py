@@ -0,0 +1,97 @@
+"""Compares SQLite read/write throughput with default journaling against the production engine settings.
+
+Simulates a forum vote storm: reader threads repeatedly load a query's votes while writer threads
+insert votes and commit. Run from the repository root:
+
+    python benchmarks/db_concurrency.py --readers 8 --writers 4 --seconds 5
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+from app import build_engine_options, configure_sqlite_connection  # noqa: E402
+
+
+def make_engine(path, tuned):
+    url = f"sqlite:///{path}"
+    if not tuned:
+        return create_engine(url)
+    engine = create_engine(url, **build_engine_options(url))
+    event.listen(engine, 'connect', configure_sqlite_connection)
+    return engine
+
+
+def setup_schema(engine):
+    with engine.begin() as con:
+        con.execute(text('CREATE TABLE vote (id INTEGER PRIMARY KEY, user_id INTEGER, query_id INTEGER, vote_type VARCHAR(10))'))
+        con.execute(text('CREATE INDEX ix_vote_query ON vote (query_id)'))
+        con.execute(
+            text('INSERT INTO vote (user_id, query_id, vote_type) VALUES (:u, :q, :v)'),
+            [{'u': i, 'q': i % 50, 'v': 'like'} for i in range(5000)]
+        )
+
+
+def run(engine, readers, writers, seconds):
+    counts = {'reads': 0, 'writes': 0, 'locked': 0}
+    lock = threading.Lock()
+    stop = time.perf_counter() + seconds
+
+    def reader(n):
+        done = 0
+        while time.perf_counter() < stop:
+            with engine.connect() as con:
+                con.execute(text('SELECT vote_type, COUNT(*) FROM vote WHERE query_id = :q GROUP BY vote_type'), {'q': n % 50}).all()
+            done += 1
+        with lock:
+            counts['reads'] += done
+
+    def writer(n):
+        done, locked = 0, 0
+        while time.perf_counter() < stop:
+            try:
+                with engine.begin() as con:
+                    con.execute(text('INSERT INTO vote (user_id, query_id, vote_type) VALUES (:u, :q, :v)'), {'u': n, 'q': done % 50, 'v': 'dislike'})
+                done += 1
+            except OperationalError:
+                locked += 1
+        with lock:
+            counts['writes'] += done
+            counts['locked'] += locked
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"{args.readers} readers, {args.writers} writers, {args.seconds:g}s per mode")
+    print(f"{'mode':<10} {'reads/s':>10} {'writes/s':>10} {'locked':>8}")
+    for label, tuned in (('default', False), ('tuned', True)):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = make_engine(os.path.join(tmp, 'bench.db'), tuned)
+            setup_schema(engine)
+            counts = run(engine, args.readers, args.writers, args.seconds)
+            engine.dispose()
+        print(f"{label:<10} {counts['reads'] / args.seconds:>10.0f} {counts['writes'] / args.seconds:>10.0f} {counts['locked']:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Measures what a fresh worker pays to build the app: wall time, peak RSS and the heavy libraries loaded.
+
+Each run imports `app` and calls create_app() in a new interpreter, as a gunicorn worker or `flask`
+command would, then imports the prediction libraries to show what the first prediction or spreadsheet upload adds.
+Run from the repository root; point --app-dir at another checkout to compare against it:
+
+    python benchmarks/worker_boot.py --runs 5
+    git worktree add /tmp/before HEAD~1 && python benchmarks/worker_boot.py --app-dir /tmp/before
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+HEAVY_MODULES = ('numpy', 'pandas', 'sklearn', 'openpyxl')
+
+CHILD = r'''
+import json, resource, sys, time
+def peak_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+sys.path.insert(0, '.')
+start = time.perf_counter()
+import app
+if hasattr(app, 'create_app'):  # older checkouts build the app at import
+    app.create_app()
+imported = time.perf_counter()
+result = {'import_s': imported - start, 'import_rss_mb': peak_rss_mb(),
+          'loaded': [m for m in HEAVY_MODULES if m in sys.modules]}
+import pandas, sklearn.ensemble
+result['first_use_s'] = time.perf_counter() - imported
+result['first_use_rss_mb'] = peak_rss_mb()
+print(json.dumps(result))
+'''
+
+
+def measure(app_dir, database_url):
+    env = dict(os.environ, DATABASE_URL=database_url)
+    code = f"HEAVY_MODULES = {HEAVY_MODULES!r}\n{CHILD}"
+    output = subprocess.run([sys.executable, '-c', code], cwd=app_dir, env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--app-dir', default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{os.path.join(tmp, 'boot.db')}"
+        measure(args.app_dir, database_url)  # warms the OS file cache and the .pyc files
+        runs = [measure(args.app_dir, database_url) for _ in range(args.runs)]
+
+    print(f"{args.app_dir}: median of {args.runs} runs")
+    print(f"  create app          {statistics.median(r['import_s'] for r in runs) * 1000:>8.0f} ms"
+          f"  {statistics.median(r['import_rss_mb'] for r in runs):>6.1f} MB peak RSS")
+    print(f"  + first prediction  {statistics.median(r['first_use_s'] for r in runs) * 1000:>8.0f} ms"
+          f"  {statistics.median(r['first_use_rss_mb'] for r in runs):>6.1f} MB peak RSS")
+    print(f"  loaded on import:   {', '.join(runs[0]['loaded']) or 'none of ' + ', '.join(HEAVY_MODULES)}")
+
+
+if __name__ == '__main__':
+    main()
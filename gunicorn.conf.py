@@ -0,0 +1,35 @@
+"""Gunicorn settings, read from the working directory by `gunicorn 'app:create_app()'`.
+
+GUNICORN_PRELOAD=1 builds the app once in the master process and trains every cohort's prediction
+model there before forking. Workers then share those pages copy-on-write instead of each importing
+pandas and scikit-learn and training the models again on their first predictions.
+
+Without preloading, MODEL_WARMUP=1 has each worker train the models in a background thread as it
+boots, largest cohort first; /healthz/ready reports when the largest ones are done.
+"""
+import gc
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '127.0.0.1:8000')
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+preload_app = os.environ.get('GUNICORN_PRELOAD', '').lower() in ('1', 'true', 'yes')
+
+
+def when_ready(server):
+    if not preload_app:
+        return
+    from app import warm_models
+
+    ready = warm_models()
+    server.log.info("Warmed %d prediction model(s) before forking: %s", len(ready),
+                    ', '.join(f"{branch} Sem {sem}" for branch, sem in ready) or 'none')
+    # Objects that exist now are never collected, so the collector does not write to (and so copy)
+    # the pages every worker shares.
+    gc.freeze()
+
+
+def post_worker_init(worker):
+    from app import start_model_warmup
+
+    start_model_warmup(worker.wsgi)
@@ -0,0 +1,135 @@
+// Sends the files of a form through the chunked upload API before the form is submitted, so a large
+// note or attachment survives a flaky connection: each chunk is retried, and an interrupted upload
+// resumes from the offset the server reports, even after the page is reloaded.
+//
+// A form opts in with data-chunked-upload="upload_id" (one file) or "upload_ids[]" (several); the named
+// hidden inputs replace the file input, which is disabled so the browser does not send the file again.
+(function () {
+    const RETRIES = 5;
+
+    function sleep(ms) {
+        return new Promise(resolve => setTimeout(resolve, ms));
+    }
+
+    async function sha256Hex(blob) {
+        if (!(window.crypto && crypto.subtle)) {
+            return null;  // only available on HTTPS pages; the server then skips the chunk check
+        }
+        const digest = await crypto.subtle.digest('SHA-256', await blob.arrayBuffer());
+        return Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('');
+    }
+
+    async function callApi(url, options) {
+        const response = await fetch(url, Object.assign({credentials: 'same-origin'}, options));
+        const body = await response.json().catch(() => ({}));
+        return {response, body};
+    }
+
+    async function openUpload(file) {
+        const resumeKey = `chunked-upload:${file.name}:${file.size}:${file.lastModified}`;
+        const saved = localStorage.getItem(resumeKey);
+        if (saved) {
+            const {response, body} = await callApi(`/admin/uploads/${saved}`);
+            if (response.ok) {
+                return {id: body.id, offset: body.offset, chunkSize: body.chunk_size, resumeKey};
+            }
+        }
+        const {response, body} = await callApi('/admin/uploads', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({file_name: file.name, size: file.size}),
+        });
+        if (!response.ok) {
+            throw new Error(body.error || `Could not start uploading ${file.name}.`);
+        }
+        localStorage.setItem(resumeKey, body.id);
+        return {id: body.id, offset: body.offset, chunkSize: body.chunk_size, resumeKey};
+    }
+
+    async function uploadFile(file, onProgress) {
+        const upload = await openUpload(file);
+        let offset = upload.offset;
+        let failures = 0;
+        while (offset < file.size) {
+            const chunk = file.slice(offset, offset + upload.chunkSize);
+            const headers = {'Content-Type': 'application/octet-stream', 'Upload-Offset': String(offset)};
+            const checksum = await sha256Hex(chunk);
+            if (checksum) {
+                headers['Upload-Checksum'] = checksum;
+            }
+            try {
+                const {response, body} = await callApi(`/admin/uploads/${upload.id}`, {method: 'PUT', headers, body: chunk});
+                if (response.status === 404 || response.status === 413) {
+                    throw Object.assign(new Error(body.error || `Upload of ${file.name} failed.`), {fatal: true});
+                }
+                if (body.offset === undefined) {
+                    throw new Error(body.error || `Upload of ${file.name} failed.`);
+                }
+                // A 409 or a damaged chunk still reports where the server is, so carry on from there.
+                offset = body.offset;
+                failures = response.ok ? 0 : failures + 1;
+            } catch (err) {
+                if (err.fatal || ++failures > RETRIES) {
+                    throw err;
+                }
+                await sleep(1000 * 2 ** failures);
+                const {response, body} = await callApi(`/admin/uploads/${upload.id}`).catch(() => ({response: {ok: false}}));
+                if (response.ok) {
+                    offset = body.offset;
+                }
+            }
+            if (failures > RETRIES) {
+                throw new Error(`Upload of ${file.name} keeps failing.`);
+            }
+            onProgress(offset);
+        }
+        return upload;
+    }
+
+    function progressBar(input) {
+        const wrapper = document.createElement('div');
+        wrapper.className = 'progress mt-2';
+        wrapper.innerHTML = '<div class="progress-bar progress-bar-striped progress-bar-animated" role="progressbar" style="width: 0%"></div>';
+        input.insertAdjacentElement('afterend', wrapper);
+        return wrapper;
+    }
+
+    document.addEventListener('submit', async function (event) {
+        const form = event.target;
+        const fieldName = form.dataset.chunkedUpload;
+        const input = fieldName && form.querySelector('input[type="file"]');
+        if (!input || !input.files.length || !window.fetch || !window.Blob || !Blob.prototype.slice) {
+            return;
+        }
+        event.preventDefault();
+        const files = Array.from(input.files);
+        const total = files.reduce((sum, file) => sum + file.size, 0) || 1;
+        const submitButton = form.querySelector('[type="submit"]');
+        const bar = progressBar(input);
+        submitButton && (submitButton.disabled = true);
+        try {
+            let done = 0;
+            const uploads = [];
+            for (const file of files) {
+                uploads.push(await uploadFile(file, offset => {
+                    bar.firstChild.style.width = `${Math.round(100 * (done + offset) / total)}%`;
+                }));
+                done += file.size;
+            }
+            for (const upload of uploads) {
+                const hidden = document.createElement('input');
+                hidden.type = 'hidden';
+                hidden.name = fieldName;
+                hidden.value = upload.id;
+                form.appendChild(hidden);
+                localStorage.removeItem(upload.resumeKey);
+            }
+            input.disabled = true;
+            form.submit();
+        } catch (err) {
+            bar.remove();
+            submitButton && (submitButton.disabled = false);
+            alert(`${err.message} Submit the form again to resume.`);
+        }
+    });
+})();
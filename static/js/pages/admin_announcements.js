@@ -0,0 +1,60 @@
+document.addEventListener('DOMContentLoaded', () => {
+    const tooltipTriggerList = document.querySelectorAll('[data-bs-toggle="tooltip"]');
+    const tooltipList = [...tooltipTriggerList].map(tooltipTriggerEl => new bootstrap.Tooltip(tooltipTriggerEl));
+
+    // Edit Modal logic
+    const editAnnouncementModal = document.getElementById('editAnnouncementModal');
+    if (editAnnouncementModal) {
+        editAnnouncementModal.addEventListener('show.bs.modal', event => {
+            const button = event.relatedTarget;
+            const announcementId = button.getAttribute('data-announcement-id');
+            const announcementTitle = button.getAttribute('data-announcement-title');
+            const announcementContent = button.getAttribute('data-announcement-content');
+            const attachedFilesString = button.getAttribute('data-attached-files');
+
+            const modalTitle = editAnnouncementModal.querySelector('.modal-title');
+            const form = document.getElementById('editAnnouncementForm');
+            const titleInput = document.getElementById('edit-title');
+            const contentInput = document.getElementById('edit-content');
+            const currentFilesDiv = document.getElementById('current-attached-files');
+
+            modalTitle.textContent = `Edit Announcement - ${announcementTitle}`;
+            form.action = `/admin/announcements/edit/${announcementId}`;
+            titleInput.value = announcementTitle;
+            contentInput.value = announcementContent;
+
+            currentFilesDiv.innerHTML = '';
+            if (attachedFilesString && attachedFilesString.length > 0) {
+                const files = attachedFilesString.split(',');
+                files.forEach(file => {
+                    if (file) {
+                        const fileBadge = document.createElement('span');
+                        fileBadge.classList.add('badge', 'bg-secondary', 'me-2');
+                        fileBadge.textContent = file;
+                        currentFilesDiv.appendChild(fileBadge);
+                    }
+                });
+            } else {
+                currentFilesDiv.innerHTML = '<span class="text-muted">No files currently attached.</span>';
+            }
+        });
+    }
+
+    // Delete Modal logic
+    const confirmDeleteModal = document.getElementById('confirmDeleteModal');
+    if (confirmDeleteModal) {
+        let deleteActionUrl = '';
+        const confirmDeleteBtn = document.getElementById('confirmDeleteBtn');
+        confirmDeleteModal.addEventListener('show.bs.modal', event => {
+            const button = event.relatedTarget;
+            deleteActionUrl = button.dataset.action;
+        });
+        confirmDeleteBtn.addEventListener('click', () => {
+            const form = document.createElement('form');
+            form.method = 'POST';
+            form.action = deleteActionUrl;
+            document.body.appendChild(form);
+            form.submit();
+        });
+    }
+});
@@ -0,0 +1,151 @@
+const pageData = JSON.parse(document.getElementById('page-data').textContent);
+
+document.addEventListener('DOMContentLoaded', function () {
+    // Common variables
+    const subjectsData = pageData.subjects;
+    const adminDepartment = pageData.adminDepartment;
+    const previewModal = new bootstrap.Modal(document.getElementById('previewModal'));
+    const previewSpinner = document.getElementById('previewSpinner');
+    const previewContent = document.getElementById('preview-content');
+
+    // --- Note Uploader Logic ---
+    const branchFilter = document.getElementById('branchFilter');
+    const semesterFilter = document.getElementById('semesterFilter');
+    const subjectSelect = document.getElementById('subject_id');
+
+    function updateSemesters() {
+        const selectedBranch = branchFilter.value;
+        semesterFilter.innerHTML = '<option value="">Select Semester</option>';
+        subjectSelect.innerHTML = '<option value="">First, select branch and semester</option>';
+        semesterFilter.disabled = true;
+        subjectSelect.disabled = true;
+
+        if (selectedBranch && subjectsData[selectedBranch]) {
+            const semesters = Object.keys(subjectsData[selectedBranch]);
+            semesters.forEach(sem => {
+                const option = document.createElement('option');
+                option.value = sem;
+                option.textContent = sem;
+                semesterFilter.appendChild(option);
+            });
+            semesterFilter.disabled = false;
+        }
+    }
+
+    function updateSubjects() {
+        const selectedBranch = branchFilter.value;
+        const selectedSem = semesterFilter.value;
+        subjectSelect.innerHTML = '<option value="">Select Subject</option>';
+        subjectSelect.disabled = true;
+
+        if (selectedBranch && selectedSem && subjectsData[selectedBranch][selectedSem]) {
+            const subjects = subjectsData[selectedBranch][selectedSem];
+            subjects.forEach(subject => {
+                const option = document.createElement('option');
+                option.value = subject.id;
+                option.textContent = subject.name;
+                subjectSelect.appendChild(option);
+            });
+            subjectSelect.disabled = false;
+        }
+    }
+    branchFilter.addEventListener('change', updateSemesters);
+    semesterFilter.addEventListener('change', updateSubjects);
+    if (adminDepartment !== 'ALL_BRANCHES') {
+        updateSemesters();
+    }
+
+    // --- Analytics Uploader Logic (MODIFIED) ---
+    const guidelinesPrompt = document.getElementById('guidelines-prompt');
+    const uploaderForm = document.getElementById('analytics-uploader-form');
+    const guidelinesModalEl = document.getElementById('guidelinesModal');
+    const guidelinesCheckbox = document.getElementById('guidelinesCheckbox');
+    const guidelinesUnderstoodBtn = document.getElementById('guidelinesUnderstoodBtn');
+    const analyticsBranchSelect = document.getElementById('analyticsBranch');
+    const analyticsSemSelect = document.getElementById('analyticsSem');
+    const downloadTemplateBtn = document.getElementById('downloadTemplateBtn');
+
+    // Enable the 'Continue' button only when checkbox is checked
+    guidelinesCheckbox.addEventListener('change', function() {
+        guidelinesUnderstoodBtn.disabled = !this.checked;
+    });
+
+    // When user acknowledges, hide prompt and show the form
+    guidelinesUnderstoodBtn.addEventListener('click', function() {
+        if (guidelinesCheckbox.checked) {
+            guidelinesPrompt.style.display = 'none';
+            uploaderForm.style.display = 'block';
+        }
+    });
+
+    // Reset checkbox if modal is closed without acknowledgment
+    guidelinesModalEl.addEventListener('hidden.bs.modal', function () {
+        guidelinesCheckbox.checked = false;
+        guidelinesUnderstoodBtn.disabled = true;
+    });
+
+    function checkTemplateButtonState() {
+        downloadTemplateBtn.disabled = !(analyticsBranchSelect.value && analyticsSemSelect.value);
+    }
+
+    analyticsBranchSelect.addEventListener('change', checkTemplateButtonState);
+    analyticsSemSelect.addEventListener('change', checkTemplateButtonState);
+
+    downloadTemplateBtn.addEventListener('click', function() {
+        const branch = analyticsBranchSelect.value;
+        const sem = analyticsSemSelect.value;
+        if (branch && sem) {
+            const downloadUrl = `/admin/download_analytics_template?branch=${branch}&sem=${sem}`;
+            window.location.href = downloadUrl;
+        }
+    });
+
+    if (adminDepartment !== 'ALL_BRANCHES') {
+        checkTemplateButtonState();
+    }
+
+    // --- Shared Modal & Preview Logic ---
+    document.querySelectorAll('.preview-csv-btn').forEach(button => {
+        button.addEventListener('click', async function () {
+            const filename = this.dataset.filename;
+            previewModal.show();
+            previewSpinner.style.display = 'block';
+            previewContent.innerHTML = '';
+            document.getElementById('previewModalLabel').textContent = `Preview: ${filename}`;
+            try {
+                const response = await fetch(`/admin/preview_analytics_data/${filename}`);
+                const data = await response.json();
+                if (data.error) {
+                    previewContent.innerHTML = `<div class="alert alert-danger">${data.error}</div>`;
+                } else {
+                    let tableHTML = '<div class="table-responsive"><table id="previewTable" class="table table-striped table-bordered"><thead><tr>';
+                    data.headers.forEach(header => { tableHTML += `<th>${header}</th>`; });
+                    tableHTML += '</tr></thead><tbody>';
+                    data.rows.forEach(row => {
+                        tableHTML += '<tr>';
+                        row.forEach(cell => { tableHTML += `<td>${cell}</td>`; });
+                        tableHTML += '</tr>';
+                    });
+                    tableHTML += '</tbody></table></div>';
+                    previewContent.innerHTML = tableHTML;
+                }
+            } catch (error) {
+                previewContent.innerHTML = `<div class="alert alert-danger">Failed to load file preview.</div>`;
+            } finally {
+                previewSpinner.style.display = 'none';
+            }
+        });
+    });
+
+    const confirmDeleteModal = new bootstrap.Modal(document.getElementById('confirmDeleteModal'));
+    const deleteForm = document.getElementById('deleteForm');
+    const confirmDeleteText = document.getElementById('confirmDeleteText');
+    document.querySelectorAll('.btn-delete').forEach(button => {
+        button.addEventListener('click', function (event) {
+            event.preventDefault();
+            confirmDeleteText.textContent = `Are you sure you want to permanently delete the file: ${this.dataset.itemName}?`;
+            deleteForm.action = this.dataset.action;
+            confirmDeleteModal.show();
+        });
+    });
+});
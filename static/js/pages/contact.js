@@ -0,0 +1,39 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const contactForm = document.getElementById('contactForm');
+    const successModal = new bootstrap.Modal(document.getElementById('successModal'));
+
+    contactForm.addEventListener('submit', function (event) {
+        event.preventDefault(); 
+
+        const formData = new FormData(contactForm);
+        const action = "https://formsubmit.co/visionedminor01@gmail.com";
+        const submitButton = contactForm.querySelector('button[type="submit"]');
+
+        submitButton.textContent = 'Sending...';
+        submitButton.disabled = true;
+
+        fetch(action, {
+            method: 'POST',
+            body: formData,
+            headers: {
+                'Accept': 'application/json'
+            }
+        })
+        .then(response => {
+            if (response.ok) {
+                successModal.show();
+                contactForm.reset(); 
+            } else {
+                alert('Oops! There was a problem submitting your form. Please try again.');
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('Oops! There was a network problem. Please try again.');
+        })
+        .finally(() => {
+            submitButton.textContent = 'Send Message';
+            submitButton.disabled = false;
+        });
+    });
+});
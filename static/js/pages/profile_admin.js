@@ -0,0 +1,122 @@
+const pageData = JSON.parse(document.getElementById('page-data').textContent);
+
+// Global variables
+const superAdminModal = document.getElementById('superAdminModal');
+const superAdminCodeInput = document.getElementById('superAdminCode');
+const modalError = document.getElementById('modal-error');
+const changeAdminCodeSection = document.getElementById('changeAdminCodeSection');
+const departmentSelect = document.getElementById('department');
+const updateProfileBtn = document.getElementById('updateProfileBtn');
+let isSuperAdminVerified = false;
+
+document.addEventListener('DOMContentLoaded', function () {
+    const profilePhotoInput = document.getElementById('profile-photo-input');
+    const profilePicPreview = document.getElementById('profile-pic-preview');
+
+    profilePhotoInput.addEventListener('change', function (event) {
+        const file = event.target.files[0];
+        if (file) {
+            const reader = new FileReader();
+            reader.onload = function (e) {
+                profilePicPreview.src = e.target.result;
+            };
+            reader.readAsDataURL(file);
+        }
+    });
+
+    if (departmentSelect.value === 'ALL_BRANCHES') {
+        isSuperAdminVerified = true;
+        changeAdminCodeSection.style.display = 'block';
+    }
+
+    let previousDepartment = departmentSelect.value;
+    departmentSelect.addEventListener('focus', function () {
+        previousDepartment = this.value;
+    });
+
+    departmentSelect.addEventListener('change', function () {
+        if (this.value === 'ALL_BRANCHES' && !isSuperAdminVerified) {
+            superAdminModal.style.display = 'flex';
+            updateProfileBtn.disabled = true;
+            this.value = previousDepartment;
+        } else {
+            updateProfileBtn.disabled = false;
+        }
+    });
+});
+
+function closeSuperAdminModal() {
+    superAdminModal.style.display = 'none';
+    updateProfileBtn.disabled = false;
+    modalError.classList.add('d-none');
+}
+
+function verifySuperAdminCode() {
+    const SUPER_ADMIN_CODE = pageData.superAdminCode;
+    if (superAdminCodeInput.value === SUPER_ADMIN_CODE) {
+        isSuperAdminVerified = true;
+        superAdminModal.style.display = 'none';
+        updateProfileBtn.disabled = false;
+        changeAdminCodeSection.style.display = 'block';
+        departmentSelect.value = 'ALL_BRANCHES';
+        modalError.classList.add('d-none');
+    } else {
+        modalError.classList.remove('d-none');
+    }
+}
+
+function validateForm() {
+    const phoneInput = document.getElementById('phone').value;
+    const currentPassword = document.getElementById('current_password').value;
+    const newPassword = document.getElementById('new_password').value;
+    const confirmPassword = document.getElementById('confirm_password').value;
+
+    const currentAdminCode = document.getElementById('current_admin_code').value;
+    const adminCode = document.getElementById('admin_code').value;
+    const confirmAdminCode = document.getElementById('confirm_admin_code').value;
+
+    if (phoneInput) {
+        const phoneRegex = /^(?:\+91)?[6-9]\d{9}$/;
+        if (!phoneRegex.test(phoneInput)) {
+            showCustomAlert('Please enter a valid 10-digit Indian phone number.');
+            return false;
+        }
+    }
+
+    if (newPassword || confirmPassword || currentPassword) {
+        if (!currentPassword) {
+            showCustomAlert('Please enter your current password to set a new one.');
+            return false;
+        }
+        if (newPassword !== confirmPassword) {
+            showCustomAlert('New passwords do not match.');
+            return false;
+        }
+        if (newPassword.length < 6) {
+            showCustomAlert('New password must be at least 6 characters long.');
+            return false;
+        }
+    }
+
+    if (adminCode || confirmAdminCode || currentAdminCode) {
+        if (!currentAdminCode) {
+            showCustomAlert('Please enter the current admin code to set a new one.');
+            return false;
+        }
+        if (adminCode !== confirmAdminCode) {
+            showCustomAlert('New admin codes do not match.');
+            return false;
+        }
+    }
+
+    return true;
+}
+
+function showCustomAlert(message) {
+    document.getElementById('customAlertMessage').textContent = message;
+    document.getElementById('customAlertModal').style.display = 'flex';
+}
+
+function closeCustomAlert() {
+    document.getElementById('customAlertModal').style.display = 'none';
+}
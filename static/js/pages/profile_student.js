@@ -0,0 +1,55 @@
+document.addEventListener('DOMContentLoaded', function () {
+    const profilePhotoInput = document.getElementById('profile-photo-input');
+    const profilePicPreview = document.getElementById('profile-pic-preview');
+
+    profilePhotoInput.addEventListener('change', function (event) {
+        const file = event.target.files[0];
+        if (file) {
+            const reader = new FileReader();
+            reader.onload = function (e) {
+                profilePicPreview.src = e.target.result;
+            }
+            reader.readAsDataURL(file);
+        }
+    });
+});
+
+function validateForm() {
+    const phoneInput = document.getElementById('phone').value;
+    const currentPassword = document.getElementById('current_password').value;
+    const newPassword = document.getElementById('new_password').value;
+    const confirmPassword = document.getElementById('confirm_password').value;
+
+    if (phoneInput) {
+        const phoneRegex = /^(?:\+91)?[6-9]\d{9}$/;
+        if (!phoneRegex.test(phoneInput)) {
+            showCustomAlert('Please enter a valid 10-digit Indian phone number (e.g., 9876543210 or +919876543210).');
+            return false;
+        }
+    }
+
+    if (newPassword || confirmPassword || currentPassword) {
+        if (!currentPassword) {
+            showCustomAlert('Please enter your current password to set a new one.');
+            return false;
+        }
+        if (newPassword !== confirmPassword) {
+            showCustomAlert('New passwords do not match.');
+            return false;
+        }
+        if (newPassword.length < 6) {
+            showCustomAlert('New password must be at least 6 characters long.');
+            return false;
+        }
+    }
+    return true;
+}
+
+function showCustomAlert(message) {
+    document.getElementById('customAlertMessage').textContent = message;
+    document.getElementById('customAlertModal').style.display = 'flex';
+}
+
+function closeCustomAlert() {
+    document.getElementById('customAlertModal').style.display = 'none';
+}
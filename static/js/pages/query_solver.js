@@ -0,0 +1,232 @@
+const pageData = JSON.parse(document.getElementById('page-data').textContent);
+
+document.addEventListener('DOMContentLoaded', () => {
+    const tooltipTriggerList = document.querySelectorAll('[data-bs-toggle="tooltip"]');
+    const tooltipList = [...tooltipTriggerList].map(tooltipTriggerEl => new bootstrap.Tooltip(
+        tooltipTriggerEl));
+
+    async function apiRequest(url, method = 'POST', body = {}) {
+        const response = await fetch(url, {
+            method: method,
+            headers: {
+                'Content-Type': 'application/json',
+                'X-Requested-With': 'XMLHttpRequest'
+            },
+            body: JSON.stringify(body)
+        });
+        if (!response.ok) {
+            const errorData = await response.json().catch(() => ({
+                message: 'An unknown error occurred'
+            }));
+            throw new Error(errorData.message || `HTTP error! status: ${response.status}`);
+        }
+        return response.json();
+    }
+
+    async function handleVoteClick(button) {
+        const {
+            entityType,
+            entityId,
+            voteType
+        } = button.dataset;
+        const footer = button.closest('.query-footer');
+        if (!entityType || !entityId || !voteType || !footer) return;
+        try {
+            const data = await apiRequest(`/admin/vote/${entityType}/${entityId}`, 'POST', {
+                vote_type: voteType
+            });
+            const likeBtn = footer.querySelector('.btn-vote.like');
+            const dislikeBtn = footer.querySelector('.btn-vote.dislike');
+            likeBtn.querySelector('.count').textContent = data.likes;
+            dislikeBtn.querySelector('.count').textContent = data.dislikes;
+            likeBtn.classList.toggle('active', data.user_vote === 'like');
+            dislikeBtn.classList.toggle('active', data.user_vote === 'dislike');
+        } catch (error) {
+            console.error("Vote failed:", error);
+        }
+    }
+    async function handleHeartClick(button) {
+        const {
+            entityType,
+            entityId
+        } = button.dataset;
+        if (!entityType || !entityId) return;
+        try {
+            const data = await apiRequest(`/admin/toggle_heart/${entityType}/${entityId}`);
+            button.classList.toggle('active', data.is_hearted);
+            const countSpan = button.querySelector('.count');
+            if (countSpan) {
+                countSpan.textContent = data.heart_count;
+            }
+        } catch (error) {
+            console.error("Heart toggle failed:", error);
+        }
+    }
+
+    function handleEditClick(button) {
+        const container = button.closest('.query-card, .reply-card');
+        if (!container) return;
+        container.querySelector('.query-body').style.display = 'none';
+        const editForm = container.querySelector('.edit-form-container');
+        editForm.style.display = 'block';
+        editForm.querySelector('textarea').focus();
+    }
+
+    function cancelEdit(button) {
+        const container = button.closest('.query-card, .reply-card');
+        if (!container) return;
+        container.querySelector('.edit-form-container').style.display = 'none';
+        container.querySelector('.query-body').style.display = 'block';
+    }
+
+    function handleReplyClick(button) {
+        const {
+            queryId,
+            parentId = ''
+        } = button.dataset;
+        const masterReplyForm = document.getElementById('master-reply-form');
+        const form = masterReplyForm.querySelector('form');
+        let targetContainer = parentId ?
+            document.querySelector(`#reply-${parentId} .replies-section-container`) :
+            document.getElementById(`reply-form-container-${queryId}`);
+        if (!targetContainer) return;
+        targetContainer.appendChild(masterReplyForm);
+        form.action = `/admin/post_reply/${queryId}`;
+        form.querySelector('input[name="parent_id"]').value = parentId;
+        masterReplyForm.style.display = 'block';
+        const textarea = masterReplyForm.querySelector('textarea');
+        textarea.value = '';
+        textarea.focus();
+    }
+
+    function cancelMasterReply() {
+        const masterReplyForm = document.getElementById('master-reply-form');
+        masterReplyForm.style.display = 'none';
+        document.body.appendChild(masterReplyForm);
+    }
+
+    function handleToggleReplies(button) {
+        const targetDiv = button.nextElementSibling;
+        if (!targetDiv || (!targetDiv.classList.contains('nested-replies') && !targetDiv.classList.contains(
+                'replies-section'))) {
+            console.error("Could not find the correct replies div to toggle.");
+            return;
+        }
+        const isHidden = targetDiv.style.display === 'none';
+        targetDiv.style.display = isHidden ? 'block' : 'none';
+        const icon = button.querySelector('i');
+        if (isHidden) {
+            icon.classList.replace('fa-caret-down', 'fa-caret-up');
+            button.innerHTML = `<i class="fas fa-caret-up"></i> Hide replies`;
+        } else {
+            icon.classList.replace('fa-caret-up', 'fa-caret-down');
+            const replyCount = button.dataset.replyCount || 0;
+            const replyText = parseInt(replyCount) === 1 ? 'reply' : 'replies';
+            button.innerHTML = `<i class="fas fa-caret-down"></i> View ${replyCount} ${replyText}`;
+        }
+    }
+
+    document.getElementById('main-container').addEventListener('click', (event) => {
+        const button = event.target.closest('button');
+        if (!button) return;
+        if (button.classList.contains('btn-vote')) {
+            handleVoteClick(button);
+        } else if (button.classList.contains('btn-heart')) {
+            handleHeartClick(button);
+        } else if (button.classList.contains('btn-edit')) {
+            handleEditClick(button);
+        } else if (button.classList.contains('btn-cancel-edit')) {
+            cancelEdit(button);
+        } else if (button.classList.contains('btn-reply')) {
+            handleReplyClick(button);
+        } else if (button.classList.contains('btn-toggle-replies')) {
+            handleToggleReplies(button);
+        }
+    });
+
+    document.getElementById('cancel-master-reply').addEventListener('click', cancelMasterReply);
+
+    const confirmDeleteModal = document.getElementById('confirmDeleteModal');
+    if (confirmDeleteModal) {
+        let deleteActionUrl = '';
+        const confirmDeleteBtn = document.getElementById('confirmDeleteBtn');
+        confirmDeleteModal.addEventListener('show.bs.modal', event => {
+            const button = event.relatedTarget;
+            deleteActionUrl = button.dataset.action;
+        });
+        confirmDeleteBtn.addEventListener('click', () => {
+            const form = document.createElement('form');
+            form.method = 'POST';
+            form.action = deleteActionUrl;
+            document.body.appendChild(form);
+            form.submit();
+        });
+    }
+
+    const confirmBlockModal = document.getElementById('confirmBlockModal');
+    if (confirmBlockModal) {
+        let actionUrl = '';
+        const confirmBtn = document.getElementById('confirmBlockBtn');
+        confirmBlockModal.addEventListener('show.bs.modal', event => {
+            const button = event.relatedTarget;
+            actionUrl = button.dataset.action;
+            const username = button.dataset.username;
+            const isBlocked = JSON.parse(button.dataset.isBlocked);
+            const targetRole = button.dataset.targetRole === 'administrator' ? 'admin' : 'user';
+            const modalBody = confirmBlockModal.querySelector('.modal-body');
+            if (isBlocked) {
+                modalBody.innerHTML =
+                    `Are you sure you want to <strong>unblock ${username}</strong> (${targetRole})?`;
+                confirmBtn.textContent = 'Yes, Unblock';
+                confirmBtn.className = 'btn btn-success';
+            } else {
+                modalBody.innerHTML =
+                    `Are you sure you want to <strong>block ${username}</strong> (${targetRole})? This will prevent them from posting.`;
+                confirmBtn.textContent = 'Yes, Block';
+                confirmBtn.className = 'btn btn-danger';
+            }
+        });
+        confirmBtn.addEventListener('click', () => {
+            const form = document.createElement('form');
+            form.method = 'POST';
+            form.action = actionUrl;
+            document.body.appendChild(form);
+            form.submit();
+        });
+    }
+
+    const confirmLockForumModal = document.getElementById('confirmLockForumModal');
+    if (confirmLockForumModal) {
+        let lockActionUrl = '';
+        const confirmLockForumBtn = document.getElementById('confirmLockForumBtn');
+        confirmLockForumModal.addEventListener('show.bs.modal', event => {
+            const button = event.relatedTarget;
+            lockActionUrl = button.dataset.action;
+            const isLocked = JSON.parse(button.dataset.isLocked);
+            const modalBody = confirmLockForumModal.querySelector('.modal-body');
+            if (isLocked) {
+                modalBody.innerHTML =
+                    `Are you sure you want to <strong>globally unlock</strong> the forum? Students will be able to post again.`;
+                confirmLockForumBtn.textContent = 'Yes, Unlock';
+                confirmLockForumBtn.className = 'btn btn-success';
+            } else {
+                modalBody.innerHTML =
+                    `Are you sure you want to <strong>globally lock</strong> the forum? This will prevent all students and admins from posting.`;
+                confirmLockForumBtn.textContent = 'Yes, Lock';
+                confirmLockForumBtn.className = 'btn btn-danger';
+            }
+        });
+        confirmLockForumBtn.addEventListener('click', () => {
+            const form = document.createElement('form');
+            form.method = 'POST';
+            form.action = lockActionUrl;
+            document.body.appendChild(form);
+            form.submit();
+        });
+    }
+
+    if (pageData.forumBlocked) {
+        const blockedModal = new bootstrap.Modal(document.getElementById('blockedInfoModal'));
+        blockedModal.show();
+    }
+});
@@ -0,0 +1,62 @@
+const pageData = JSON.parse(document.getElementById('page-data').textContent);
+
+document.addEventListener('DOMContentLoaded', function () {
+    const profilePhotoInput = document.getElementById('profile-photo-input');
+    const profilePicPreview = document.getElementById('profile-pic-preview');
+    const allowedExtensions = /(\.jpg|\.jpeg|\.png|\.gif)$/i;
+    const defaultImagePath = pageData.defaultImagePath;
+
+    profilePhotoInput.addEventListener('change', function () {
+        const file = this.files[0];
+        if (file) {
+            if (!allowedExtensions.exec(file.name)) {
+                showCustomAlert('Invalid file type. Please upload a JPG, PNG, or GIF image.');
+                this.value = '';
+                return false;
+            }
+            const reader = new FileReader();
+            reader.onload = function (e) {
+                profilePicPreview.src = e.target.result;
+            }
+            reader.readAsDataURL(file);
+        } else {
+            profilePicPreview.src = defaultImagePath;
+        }
+    });
+
+    if (!profilePicPreview.src || profilePicPreview.src.includes('None')) {
+        profilePicPreview.src = defaultImagePath;
+    }
+});
+
+function validateForm() {
+    const phoneInput = document.getElementById('phone').value;
+    const newPassword = document.getElementById('new_password').value;
+    const confirmPassword = document.getElementById('confirm_password').value;
+
+    if (phoneInput && !/^\d{10}$/.test(phoneInput)) {
+        showCustomAlert('Please enter a valid 10-digit phone number.');
+        return false;
+    }
+
+    if (newPassword || confirmPassword) {
+        if (newPassword.length < 6) {
+            showCustomAlert('New password must be at least 6 characters long.');
+            return false;
+        }
+        if (newPassword !== confirmPassword) {
+            showCustomAlert('New passwords do not match.');
+            return false;
+        }
+    }
+    return true;
+}
+
+function showCustomAlert(message) {
+    document.getElementById('customAlertMessage').textContent = message;
+    document.getElementById('customAlertModal').style.display = 'flex';
+}
+
+function closeCustomAlert() {
+    document.getElementById('customAlertModal').style.display = 'none';
+}
@@ -0,0 +1,363 @@
+const pageData = JSON.parse(document.getElementById('page-data').textContent);
+
+// Your existing JavaScript code...
+const saved_marks = {
+    ...pageData.prevSemMarks,
+    ...pageData.currentCtMarks,
+    ...pageData.attendanceMarks
+};
+
+let predictionChart = null;
+let contributionChart = null;
+let prevAttendanceChart = null;
+let predictedAttendanceChart = null;
+
+function renderPredictionChart() {
+    const predictionsData = pageData.predictions;
+    if (!predictionsData) return;
+    const ctx = document.getElementById('marksChart').getContext('2d');
+    const labels = Object.keys(predictionsData);
+    const marks = labels.map(label => predictionsData[label].mark);
+
+    const colors = ['rgba(23, 162, 184, 0.6)', 'rgba(44, 62, 80, 0.6)', 'rgba(243, 156, 18, 0.6)', 'rgba(46, 204, 113, 0.6)', 'rgba(155, 89, 182, 0.6)'];
+
+    if (predictionChart) predictionChart.destroy();
+    predictionChart = new Chart(ctx, {
+        type: 'bar',
+        data: {
+            labels: labels,
+            datasets: [{
+                label: 'Predicted Marks (out of 70)',
+                data: marks,
+                backgroundColor: colors,
+                borderColor: colors.map(c => c.replace('0.6', '1')),
+                borderWidth: 1
+            }]
+        },
+        options: {
+            indexAxis: 'y',
+            responsive: true,
+            maintainAspectRatio: false,
+            scales: {
+                x: {
+                    beginAtZero: true,
+                    max: 70
+                }
+            },
+            plugins: {
+                legend: {
+                    display: false
+                }
+            }
+        }
+    });
+}
+
+function renderContributionChart() {
+    const predictionsData = pageData.predictions;
+    if (!predictionsData) return;
+
+    const ctx = document.getElementById('contributionChart').getContext('2d');
+    const labels = Object.keys(predictionsData);
+    const marks = labels.map(label => predictionsData[label].mark);
+
+    if (contributionChart) contributionChart.destroy();
+
+    contributionChart = new Chart(ctx, {
+        type: 'pie',
+        data: {
+            labels: labels,
+            datasets: [{
+                label: 'Contribution %',
+                data: marks,
+                backgroundColor: [
+                    'rgba(23, 162, 184, 0.7)', 'rgba(44, 62, 80, 0.7)',
+                    'rgba(243, 156, 18, 0.7)', 'rgba(46, 204, 113, 0.7)',
+                    'rgba(155, 89, 182, 0.7)', 'rgba(231, 76, 60, 0.7)'
+                ],
+                borderColor: [
+                    '#17a2b8', '#2c3e50', '#f39c12', '#2ecc71', '#9b59b6', '#e74c3c'
+                ],
+                borderWidth: 1
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: {
+                    position: 'top'
+                },
+                tooltip: {
+                    callbacks: {
+                        label: function (context) {
+                            let label = context.label || '';
+                            if (label) {
+                                label += ': ';
+                            }
+                            const total = context.chart.data.datasets[0].data.reduce((a, b) => a + b, 0);
+                            const value = context.parsed;
+                            const percentage = total > 0 ? (value / total * 100).toFixed(2) : 0;
+                            return `${label}${percentage}%`;
+                        }
+                    }
+                }
+            }
+        }
+    });
+}
+
+function renderPrevAttendanceChart() {
+    const prevAttendanceData = pageData.attendanceMarks;
+    const sortedKeys = Object.keys(prevAttendanceData).map(k => parseInt(k.split('_').pop())).sort((a, b) => a - b);
+
+    if (sortedKeys.length === 0) return;
+
+    const labels = sortedKeys.map(key => `Semester ${key}`);
+    const data = sortedKeys.map(key => prevAttendanceData[`prev_attendance_${key}`]);
+
+    const ctx = document.getElementById('prevAttendanceChart').getContext('2d');
+
+    if (prevAttendanceChart) prevAttendanceChart.destroy();
+
+    const gradient = ctx.createLinearGradient(0, 0, 0, 350);
+    gradient.addColorStop(0, 'rgba(44, 62, 80, 0.5)');
+    gradient.addColorStop(1, 'rgba(44, 62, 80, 0)');
+
+    prevAttendanceChart = new Chart(ctx, {
+        type: 'line',
+        data: {
+            labels: labels,
+            datasets: [{
+                label: 'Attendance %',
+                data: data,
+                borderColor: 'rgba(44, 62, 80, 1)',
+                backgroundColor: gradient,
+                fill: true,
+                tension: 0.4,
+                pointBackgroundColor: 'rgba(44, 62, 80, 1)',
+                pointBorderColor: '#fff',
+                pointHoverRadius: 7,
+                pointHoverBackgroundColor: '#fff',
+                pointHoverBorderColor: 'rgba(44, 62, 80, 1)',
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            scales: {
+                y: {
+                    beginAtZero: true,
+                    max: 100
+                }
+            },
+            plugins: {
+                legend: {
+                    display: false
+                }
+            }
+        }
+    });
+}
+
+function renderPredictedAttendanceChart() {
+    const attendanceData = pageData.attendanceMarks;
+    const sortedKeys = Object.keys(attendanceData).map(k => parseInt(k.split('_').pop())).sort((a, b) => a - b);
+
+    if (sortedKeys.length === 0) return;
+
+    const lastSemNum = sortedKeys[sortedKeys.length - 1];
+    const lastAttendanceValue = attendanceData[`prev_attendance_${lastSemNum}`];
+    const lastAttendanceLabel = `Semester ${lastSemNum}`;
+
+    const projectedAttendanceData = pageData.projectedAttendance;
+    const projectedLabel = Object.keys(projectedAttendanceData)[0];
+    const projectedValue = projectedAttendanceData[projectedLabel];
+
+    const isUpwardTrend = projectedValue >= lastAttendanceValue;
+    const ctx = document.getElementById('predictedAttendanceChart').getContext('2d');
+
+    if (predictedAttendanceChart) predictedAttendanceChart.destroy();
+
+    const gradient = ctx.createLinearGradient(0, 0, 0, 350);
+    if (isUpwardTrend) {
+        gradient.addColorStop(0, 'rgba(46, 204, 113, 0.6)');
+        gradient.addColorStop(1, 'rgba(46, 204, 113, 0)');
+    } else {
+        gradient.addColorStop(0, 'rgba(231, 76, 60, 0.6)');
+        gradient.addColorStop(1, 'rgba(231, 76, 60, 0)');
+    }
+    const borderColor = isUpwardTrend ? 'rgba(46, 204, 113, 1)' : 'rgba(231, 76, 60, 1)';
+
+    predictedAttendanceChart = new Chart(ctx, {
+        type: 'line',
+        data: {
+            labels: [lastAttendanceLabel, projectedLabel],
+            datasets: [{
+                label: 'Attendance %',
+                data: [lastAttendanceValue, projectedValue],
+                borderColor: borderColor,
+                backgroundColor: gradient,
+                fill: true,
+                tension: 0.4,
+                borderWidth: 3,
+                borderDash: [5, 5],
+                pointBackgroundColor: borderColor,
+                pointBorderColor: '#fff',
+                pointRadius: 5,
+                pointHoverRadius: 8,
+                pointHoverBackgroundColor: '#fff',
+                pointHoverBorderColor: borderColor,
+                pointHoverBorderWidth: 2
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            scales: {
+                y: {
+                    beginAtZero: true,
+                    max: 100,
+                    ticks: {
+                        callback: function (value) { return value + '%'; }
+                    }
+                }
+            },
+            plugins: {
+                legend: { display: false },
+                tooltip: {
+                    padding: 10,
+                    callbacks: {
+                        label: function (context) {
+                            let label = context.dataset.label || '';
+                            if (label) { label += ': '; }
+                            if (context.parsed.y !== null) {
+                                label += context.parsed.y.toFixed(2) + '%';
+                            }
+                            return label;
+                        }
+                    }
+                }
+            }
+        }
+    });
+}
+
+document.addEventListener('DOMContentLoaded', function () {
+    const hasPredictions = pageData.hasPredictions;
+    const hasAttendance = pageData.hasAttendance;
+
+    if (hasPredictions) {
+        renderPredictionChart();
+        renderContributionChart();
+
+        if (hasAttendance) {
+            renderPrevAttendanceChart();
+            renderPredictedAttendanceChart();
+        }
+    }
+
+    const marksModal = document.getElementById('marksModal');
+    marksModal.addEventListener('show.bs.modal', event => {
+        populateDynamicFields(pageData.currentSubjectIds, 'ct', '_tests', 'Class Test Score', 20);
+        populateDynamicFields('prev_attendance', 'att', '_entries', 'Semester Attendance %', 100);
+    });
+});
+
+function createEntry(container, name, value, maxVal, placeholder) {
+    const entryDiv = document.createElement('div');
+    entryDiv.className = 'dynamic-entry';
+    entryDiv.innerHTML = `
+        <div class="flex-grow-1">
+            <input type="number" name="${name}" min="0" max="${maxVal}" value="${value}" class="form-control" placeholder="${placeholder}">
+        </div>
+        <button type="button" class="action-btn remove-btn" onclick="removeEntry(this)">&minus;</button>
+    `;
+    container.appendChild(entryDiv);
+}
+
+function populateDynamicFields(subjectIds, type, containerSuffix, placeholderText, maxVal) {
+    const prefixes = type === 'ct' ? subjectIds.split(',') : [subjectIds];
+    prefixes.forEach(prefix => {
+        const containerId = (type === 'ct') ? `modal-${prefix}${containerSuffix}` : `modal-attendance${containerSuffix}`;
+        const container = document.getElementById(containerId);
+        if (!container) return;
+
+        container.innerHTML = '';
+        const namePrefix = (type === 'ct') ? `${prefix}_ct` : 'prev_attendance';
+        const markKeys = Object.keys(saved_marks).filter(key => key.startsWith(namePrefix));
+
+        let maxIndex = 0;
+        markKeys.forEach(key => {
+            const num = parseInt(key.split('_').pop(), 10) || 0;
+            if (num > maxIndex) maxIndex = num;
+        });
+
+        const loopLimit = Math.max(1, markKeys.length > 0 ? maxIndex : 1);
+        for (let i = 1; i <= loopLimit; i++) {
+            const currentKey = `${namePrefix}_${i}`;
+            const value = saved_marks[currentKey] || '';
+            const placeholder = placeholderText.includes('Semester') ? `Semester ${i} Attendance %` : `${placeholderText} ${i}`;
+            createEntry(container, currentKey, value, maxVal, placeholder);
+        }
+        updateEntriesUI(containerId);
+    });
+}
+
+function addEntry(containerId, namePrefix, maxVal, placeholderText) {
+    const container = document.getElementById(containerId);
+    const isAttendance = containerId.includes('attendance');
+    const maxAllowed = isAttendance ? (pageData.studentSem - 1) : 5;
+
+    if (maxAllowed > 0 && container.children.length >= maxAllowed) {
+        showCustomAlert(`You can add a maximum of ${maxAllowed} entries.`);
+        return;
+    }
+
+    const newIndex = container.children.length + 1;
+    const placeholder = isAttendance ? `Semester ${newIndex} Attendance %` : `${placeholderText} ${newIndex}`;
+    createEntry(container, `${namePrefix}_${newIndex}`, '', maxVal, placeholder);
+    updateEntriesUI(containerId);
+}
+
+function removeEntry(button) {
+    const entryDiv = button.closest('.dynamic-entry');
+    const container = entryDiv.parentElement;
+    if (container.children.length > 1) {
+        entryDiv.remove();
+        updateEntriesUI(container.id);
+    }
+}
+
+function updateEntriesUI(containerId) {
+    const container = document.getElementById(containerId);
+    if (!container) return;
+
+    const entries = container.getElementsByClassName('dynamic-entry');
+    const isAttendance = containerId.includes('attendance');
+    const namePrefix = isAttendance ? 'prev_attendance' : containerId.replace('modal-', '').replace('_tests', '_ct');
+    const placeholderText = isAttendance ? `Semester Attendance %` : 'Class Test Score';
+
+    for (let i = 0; i < entries.length; i++) {
+        const input = entries[i].querySelector('input[type="number"]');
+        const removeBtn = entries[i].querySelector('.remove-btn');
+        const newIndex = i + 1;
+
+        if (input) {
+            input.name = `${namePrefix}_${newIndex}`;
+            input.placeholder = isAttendance ? `Semester ${newIndex} Attendance %` : `${placeholderText} ${newIndex}`;
+        }
+        if (removeBtn) {
+            removeBtn.classList.toggle('is-hidden', entries.length <= 1);
+        }
+    }
+}
+
+function showCustomAlert(message) {
+    document.getElementById('customAlertMessage').textContent = message;
+    document.getElementById('customAlertModal').style.display = 'flex';
+}
+
+function closeCustomAlert() {
+    document.getElementById('customAlertModal').style.display = 'none';
+}
@@ -0,0 +1,51 @@
+document.addEventListener('DOMContentLoaded', function () {
+    const profilePhotoInput = document.getElementById('profile-photo-input');
+    const profilePicPreview = document.getElementById('profile-pic-preview');
+
+    profilePhotoInput.addEventListener('change', function () {
+        const file = this.files[0];
+        if (file) {
+            const reader = new FileReader();
+            reader.onload = function (e) {
+                profilePicPreview.src = e.target.result;
+            }
+            reader.readAsDataURL(file);
+        }
+    });
+});
+
+// Custom validation and alert functions
+function validateForm() {
+    const phoneInput = document.getElementById('phone').value;
+    const newPassword = document.getElementById('new_password').value;
+    const confirmPassword = document.getElementById('confirm_password').value;
+
+    // --- Phone Number Validation ---
+    if (phoneInput && !/^\d{10}$/.test(phoneInput)) {
+        showCustomAlert('Please enter a valid 10-digit phone number.');
+        return false;
+    }
+
+    // --- Password Validation ---
+    if (newPassword || confirmPassword) {
+        if (newPassword.length < 6) {
+            showCustomAlert('New password must be at least 6 characters long.');
+            return false;
+        }
+        if (newPassword !== confirmPassword) {
+            showCustomAlert('New passwords do not match.');
+            return false;
+        }
+    }
+
+    return true; // All checks passed
+}
+
+function showCustomAlert(message) {
+    document.getElementById('customAlertMessage').textContent = message;
+    document.getElementById('customAlertModal').style.display = 'flex';
+}
+
+function closeCustomAlert() {
+    document.getElementById('customAlertModal').style.display = 'none';
+}
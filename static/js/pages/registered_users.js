@@ -0,0 +1,227 @@
+const pageData = JSON.parse(document.getElementById('page-data').textContent);
+
+document.addEventListener('DOMContentLoaded', function () {
+    const studentTableContainer = document.getElementById('student-table-container');
+    const adminTableContainer = document.getElementById('admin-table-container');
+    const toggleButton = document.getElementById('toggle-view-btn');
+    const mainTitle = document.getElementById('main-title');
+
+    const studentSearchInput = document.getElementById('student-search-input');
+    const adminSearchInput = document.getElementById('admin-search-input');
+
+    const sortSelectStudent = document.getElementById('sort-by-student');
+    const branchSelectStudent = document.getElementById('branch-select-student');
+    const sortSelectAdmin = document.getElementById('sort-by-admin');
+
+    let currentView = pageData.viewAs;
+    let debounceTimer;
+
+    const fetchAndRenderTable = async (viewAs, searchQuery, sortBy, branch, cursor = null) => {
+        clearTimeout(debounceTimer);
+        debounceTimer = setTimeout(async () => {
+            const url = new URL(pageData.searchUrl, window.location.origin);
+            url.searchParams.append('view_as', viewAs);
+            url.searchParams.append('search', searchQuery);
+            url.searchParams.append('sort_by', sortBy);
+            if (branch) {
+                url.searchParams.append('branch', branch);
+            }
+            if (cursor) {
+                url.searchParams.append('cursor', cursor);
+            }
+            const newUrl = new URL(window.location);
+            newUrl.searchParams.set('view_as', viewAs);
+            newUrl.searchParams.set('search', searchQuery);
+            newUrl.searchParams.set('sort_by', sortBy);
+            if (branch) newUrl.searchParams.set('branch', branch);
+            else newUrl.searchParams.delete('branch');
+
+            window.history.pushState({}, '', newUrl);
+
+
+            const response = await fetch(url);
+            const data = await response.json();
+
+            const tableBodyId = viewAs === 'students' ? 'student-table-body' : 'admin-table-body';
+            const tableBody = document.getElementById(tableBodyId);
+            // Live results page with "Load more", so the server-rendered pager no longer applies.
+            const studentPager = document.getElementById('student-pager');
+            if (studentPager) studentPager.remove();
+            const colspan = viewAs === 'students' ? 8 : 7;
+            let rowOffset = 0;
+            if (cursor) {
+                // Appending the next page: drop the "Load more" row and keep numbering.
+                const loadMoreRow = tableBody.querySelector('.load-more-row');
+                if (loadMoreRow) loadMoreRow.remove();
+                rowOffset = tableBody.rows.length;
+            } else {
+                tableBody.innerHTML = '';
+            }
+
+            if (data.results.length === 0 && !cursor) {
+                tableBody.innerHTML = `<tr><td colspan="${colspan}" class="text-center text-muted">No users found.</td></tr>`;
+                return;
+            }
+
+            data.results.forEach((item, i) => {
+                const index = rowOffset + i;
+                const row = document.createElement('tr');
+
+                let photoPath = item.profile_photo;
+                if (photoPath && !photoPath.startsWith('images/')) {
+                    photoPath = 'images/' + photoPath;
+                }
+
+                if (viewAs === 'students') {
+                    const actionsHtml = `
+                        <div class="d-flex justify-content-center gap-2">
+                            <a href="${item.edit_url}" class="btn btn-sm btn-outline-primary btn-icon-text" title="Edit">
+                                <i class="fas fa-edit"></i> Edit
+                            </a>
+                            <a href="${item.analytics_url}" class="btn btn-sm btn-outline-info btn-icon-text" title="Analytics">
+                                <i class="fas fa-chart-line"></i> Analytics
+                            </a>
+                            <button type="button" class="btn btn-sm btn-outline-danger btn-icon-text"
+                                data-bs-toggle="modal" data-bs-target="#confirmDeleteModal"
+                                data-action="${item.delete_url}" title="Delete">
+                                <i class="fas fa-trash-alt"></i> Delete
+                            </button>
+                        </div>
+                    `;
+                    row.innerHTML = `
+                        <td>${index + 1}</td>
+                        <td><img src="/static/uploads/${photoPath}" class="table-profile-img" alt="Profile Photo"></td>
+                        <td>${item.name}</td>
+                        <td>${item.reg_no}</td>
+                        <td>${item.branch}</td>
+                        <td>${item.sem}</td>
+                        <td>${item.email}</td>
+                        <td class="text-center">${actionsHtml}</td>
+                    `;
+                } else { // Admins
+
+                    let actionsHtml = '';
+
+                    const currentUserId = pageData.currentUserId;
+
+                    // Make sure we compare correct id field
+                    const rowUserId = item.user_id || item.id || item.admin_id;
+
+                    // Show Edit/Delete if:
+                    // 1. It is NOT a Super Admin (department !== 'ALL_BRANCHES')
+                    // OR
+                    // 2. It is the currently logged-in user
+
+                    if (item.department !== 'ALL_BRANCHES' || String(rowUserId) === String(currentUserId)) {
+
+                        actionsHtml = `
+                            <div class="d-flex justify-content-center gap-2">
+                                <a href="${item.edit_url}" 
+                                class="btn btn-sm btn-outline-primary btn-icon-text" 
+                                title="Edit">
+                                    <i class="fas fa-edit"></i> Edit
+                                </a>
+
+                                <button type="button" 
+                                    class="btn btn-sm btn-outline-danger btn-icon-text"
+                                    data-bs-toggle="modal" 
+                                    data-bs-target="#confirmDeleteModal"
+                                    data-action="${item.delete_url}" 
+                                    title="Delete">
+                                    <i class="fas fa-trash-alt"></i> Delete
+                                </button>
+                            </div>
+                        `;
+                    }
+
+                    row.innerHTML = `
+                        <td>${index + 1}</td>
+                        <td>
+                            <img src="/static/uploads/${photoPath}" 
+                                class="table-profile-img" 
+                                alt="Profile Photo">
+                        </td>
+                        <td>${item.name}</td>
+                        <td>${item.department}</td>
+                        <td>${item.phone || '-'}</td>
+                        <td>${item.email}</td>
+                        <td class="text-center">${actionsHtml}</td>
+                    `;
+                }
+                tableBody.appendChild(row);
+            });
+
+            if (data.next_cursor) {
+                const loadMoreRow = document.createElement('tr');
+                loadMoreRow.className = 'load-more-row';
+                loadMoreRow.innerHTML = `<td colspan="${colspan}" class="text-center">
+                    <button type="button" class="btn btn-sm btn-outline-secondary">Load more</button></td>`;
+                loadMoreRow.querySelector('button').addEventListener('click', () => {
+                    fetchAndRenderTable(viewAs, searchQuery, sortBy, branch, data.next_cursor);
+                });
+                tableBody.appendChild(loadMoreRow);
+            }
+        }, cursor ? 0 : 300);
+    };
+
+    const addEventListeners = () => {
+        if (studentSearchInput) {
+            studentSearchInput.addEventListener('input', () => {
+                const sortBy = sortSelectStudent.value;
+                const branch = branchSelectStudent ? branchSelectStudent.value : pageData.selectedBranch;
+                fetchAndRenderTable('students', studentSearchInput.value, sortBy, branch);
+            });
+        }
+        if (branchSelectStudent) {
+            branchSelectStudent.addEventListener('change', () => {
+                const sortBy = sortSelectStudent.value;
+                const branch = branchSelectStudent.value;
+                fetchAndRenderTable('students', studentSearchInput.value, sortBy, branch);
+            });
+        }
+        if (sortSelectStudent) {
+            sortSelectStudent.addEventListener('change', () => {
+                const sortBy = sortSelectStudent.value;
+                const branch = branchSelectStudent ? branchSelectStudent.value : pageData.selectedBranch;
+                fetchAndRenderTable('students', studentSearchInput.value, sortBy, branch);
+            });
+        }
+        if (adminSearchInput) {
+            adminSearchInput.addEventListener('input', () => {
+                const sortBy = sortSelectAdmin.value;
+                fetchAndRenderTable('admins', adminSearchInput.value, sortBy, null);
+            });
+        }
+        if (sortSelectAdmin) {
+            sortSelectAdmin.addEventListener('change', () => {
+                const sortBy = sortSelectAdmin.value;
+                fetchAndRenderTable('admins', adminSearchInput.value, sortBy, null);
+            });
+        }
+    };
+    addEventListeners();
+
+    if (toggleButton) {
+        toggleButton.addEventListener('click', function () {
+            const newView = currentView === 'students' ? 'admins' : 'students';
+            window.location.href = `${pageData.registeredUsersUrl}?view_as=${newView}`;
+        });
+    }
+
+    const confirmDeleteModal = document.getElementById('confirmDeleteModal');
+    if (confirmDeleteModal) {
+        let deleteActionUrl = '';
+        const confirmDeleteBtn = document.getElementById('confirmDeleteBtn');
+        confirmDeleteModal.addEventListener('show.bs.modal', event => {
+            const button = event.relatedTarget;
+            deleteActionUrl = button.dataset.action;
+        });
+        confirmDeleteBtn.addEventListener('click', () => {
+            const form = document.createElement('form');
+            form.method = 'POST';
+            form.action = deleteActionUrl;
+            document.body.appendChild(form);
+            form.submit();
+        });
+    }
+});
@@ -0,0 +1,13 @@
+function toggleAdminCode() {
+    const roleSelect = document.getElementById('role');
+    const adminField = document.getElementById('admin-code-field');
+    const adminInput = adminField.querySelector('input');
+
+    if (roleSelect.value === 'administrator') {
+        adminField.classList.remove('d-none');
+        adminInput.required = true;
+    } else {
+        adminField.classList.add('d-none');
+        adminInput.required = false;
+    }
+}
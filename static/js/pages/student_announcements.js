@@ -0,0 +1,18 @@
+const pageData = JSON.parse(document.getElementById('page-data').textContent);
+
+// Polls the delta endpoint, which only returns announcements changed since the last check.
+(function () {
+    let since = pageData.since;
+    const alertBox = document.getElementById('new-announcements-alert');
+    setInterval(async () => {
+        try {
+            const response = await fetch(`${pageData.updatesUrl}?since=${encodeURIComponent(since)}`);
+            if (!response.ok) return;
+            const data = await response.json();
+            since = data.since;
+            if (data.announcements.length) alertBox.classList.remove('d-none');
+        } catch (error) {
+            console.error('Error checking for new announcements:', error);
+        }
+    }, 60000);
+})();
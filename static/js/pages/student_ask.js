@@ -0,0 +1,176 @@
+const pageData = JSON.parse(document.getElementById('page-data').textContent);
+
+document.addEventListener('DOMContentLoaded', () => {
+    // Initialize Bootstrap Tooltips
+    const tooltipTriggerList = document.querySelectorAll('[data-bs-toggle="tooltip"]');
+    const tooltipList = [...tooltipTriggerList].map(tooltipTriggerEl => new bootstrap.Tooltip(tooltipTriggerEl));
+
+    const isUserBlocked = pageData.isUserBlocked;
+    const blockedModal = new bootstrap.Modal(document.getElementById('blockedModal'));
+
+    async function apiRequest(url, method = 'POST', body = {}) {
+        const response = await fetch(url, {
+            method: method,
+            headers: {
+                'Content-Type': 'application/json',
+                'X-Requested-With': 'XMLHttpRequest'
+            },
+            body: JSON.stringify(body)
+        });
+        if (!response.ok) {
+            const errorData = await response.json().catch(() => ({
+                message: 'An unknown error occurred'
+            }));
+            throw new Error(errorData.message || `HTTP error! status: ${response.status}`);
+        }
+        return response.json();
+    }
+
+    async function handleVoteClick(button) {
+        const {
+            entityType,
+            entityId,
+            voteType
+        } = button.dataset;
+        const footer = button.closest('.query-footer');
+        if (!entityType || !entityId || !voteType || !footer) return;
+        try {
+            const data = await apiRequest(`/student/vote/${entityType}/${entityId}`, 'POST', {
+                vote_type: voteType
+            });
+            const likeBtn = footer.querySelector('.btn-vote.like');
+            const dislikeBtn = footer.querySelector('.btn-vote.dislike');
+            likeBtn.querySelector('.count').textContent = data.likes;
+            dislikeBtn.querySelector('.count').textContent = data.dislikes;
+            likeBtn.classList.toggle('active', data.user_vote === 'like');
+            dislikeBtn.classList.toggle('active', data.user_vote === 'dislike');
+        } catch (error) {
+            console.error("Vote failed:", error);
+            alert('Could not cast vote. Please try again.');
+        }
+    }
+
+    function handleEditClick(button) {
+        if (isUserBlocked) {
+            blockedModal.show();
+            return;
+        }
+        const container = button.closest('.query-card, .reply-card');
+        if (!container) return;
+        container.querySelector('.query-body').style.display = 'none';
+        const editForm = container.querySelector('.edit-form-container');
+        editForm.style.display = 'block';
+        editForm.querySelector('textarea').focus();
+    }
+
+    function cancelEdit(button) {
+        const container = button.closest('.query-card, .reply-card');
+        if (!container) return;
+        container.querySelector('.edit-form-container').style.display = 'none';
+        container.querySelector('.query-body').style.display = 'block';
+    }
+
+    function handleReplyClick(button) {
+        if (isUserBlocked) {
+            blockedModal.show();
+            return;
+        }
+        const {
+            queryId,
+            parentId = ''
+        } = button.dataset;
+        const masterReplyForm = document.getElementById('master-reply-form');
+        const form = masterReplyForm.querySelector('form');
+        let targetContainer = parentId ?
+            document.querySelector(`#reply-${parentId} .replies-section-container`) :
+            document.getElementById(`reply-form-container-${queryId}`);
+        if (!targetContainer) return;
+        targetContainer.appendChild(masterReplyForm);
+        form.action = `/student/post_reply/${queryId}`;
+        form.querySelector('input[name="parent_id"]').value = parentId;
+        masterReplyForm.style.display = 'block';
+        const textarea = masterReplyForm.querySelector('textarea');
+        textarea.value = '';
+        textarea.focus();
+    }
+
+    function cancelMasterReply() {
+        const masterReplyForm = document.getElementById('master-reply-form');
+        masterReplyForm.style.display = 'none';
+        document.body.appendChild(masterReplyForm);
+    }
+
+    function handleToggleReplies(button) {
+        const targetDiv = button.nextElementSibling;
+        if (!targetDiv || (!targetDiv.classList.contains('nested-replies') && !targetDiv.classList.contains(
+                'replies-section'))) {
+            return;
+        }
+        const isHidden = targetDiv.style.display === 'none';
+        targetDiv.style.display = isHidden ? 'block' : 'none';
+        const icon = button.querySelector('i');
+
+        if (isHidden) {
+            icon.classList.replace('fa-caret-down', 'fa-caret-up');
+            button.innerHTML = `<i class="fas fa-caret-up"></i> Hide replies`;
+        } else {
+            icon.classList.replace('fa-caret-up', 'fa-caret-down');
+            const replyCount = button.dataset.replyCount || 0;
+            const replyText = parseInt(replyCount) === 1 ? 'reply' : 'replies';
+            button.innerHTML = `<i class="fas fa-caret-down"></i> View ${replyCount} ${replyText}`;
+        }
+    }
+
+    document.getElementById('main-container').addEventListener('click', (event) => {
+        const button = event.target.closest('button');
+        if (!button) return;
+
+        if (isUserBlocked && (button.classList.contains('btn-edit') || button.classList.contains(
+                'btn-reply') || (button.type === 'submit' && button.closest('form')))) {
+            event.preventDefault();
+            blockedModal.show();
+            return;
+        }
+
+        if (button.classList.contains('btn-vote')) {
+            handleVoteClick(button);
+        } else if (button.classList.contains('btn-edit')) {
+            handleEditClick(button);
+        } else if (button.classList.contains('btn-cancel-edit')) {
+            cancelEdit(button);
+        } else if (button.classList.contains('btn-reply')) {
+            handleReplyClick(button);
+        } else if (button.classList.contains('btn-toggle-replies')) {
+            handleToggleReplies(button);
+        }
+    });
+
+    const postQueryForm = document.getElementById('post-query-form');
+    if (postQueryForm) {
+        postQueryForm.addEventListener('submit', function (event) {
+            if (isUserBlocked) {
+                event.preventDefault();
+                blockedModal.show();
+            }
+        });
+    }
+
+    document.getElementById('cancel-master-reply').addEventListener('click', cancelMasterReply);
+
+    const confirmDeleteModal = document.getElementById('confirmDeleteModal');
+    if (confirmDeleteModal) {
+        let deleteActionUrl = '';
+        const confirmDeleteBtn = document.getElementById('confirmDeleteBtn');
+        confirmDeleteModal.addEventListener('show.bs.modal', event => {
+            const button = event.relatedTarget;
+            deleteActionUrl = button.dataset.action;
+        });
+        confirmDeleteBtn.addEventListener('click', () => {
+            const form = document.createElement('form');
+            form.method = 'POST';
+            form.action = deleteActionUrl;
+            document.body.appendChild(form);
+            form.submit();
+        });
+    }
+});